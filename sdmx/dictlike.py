@@ -163,7 +163,12 @@ class DictLikeDescriptor(Generic[KT, VT]):
     def __set__(self, obj, value):
         self._get_field_types(obj)
 
-        if not isinstance(value, DictLike):
+        if not isinstance(value, DictLike) and not value:
+            # Empty or omitted value, e.g. the default for a dataclass field. Defer
+            # construction of an empty DictLike until it is first accessed via __get__()
+            obj.__dict__.pop(self._name, None)
+            return
+        elif not isinstance(value, DictLike):
             # Construct new DictLike with specified types
             _value = DictLike.with_types(*self._types)
             # Update with validation
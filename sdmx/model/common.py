@@ -2,12 +2,13 @@
 # Class definitions are grouped by section of the spec, but these sections occasionally
 # appear out of order so that classes are defined before they are referenced by others.
 
+import collections.abc
 import logging
 import sys
 from abc import ABC, abstractmethod
 from collections import ChainMap
 from copy import copy
-from dataclasses import InitVar, dataclass, field, fields
+from dataclasses import Field, InitVar, dataclass, field, fields
 from datetime import date, datetime, timedelta
 from enum import Enum
 from functools import lru_cache
@@ -1098,25 +1099,43 @@ class DataProviderScheme(OrganisationScheme[DataProvider]):
 # SDMX 3.0 §5.3: Data Structure Definition
 
 
+_GROUPING_FIELDS: Dict[type, Tuple[Field, ...]] = dict()
+
+
+def _grouping_fields(cls: type) -> Tuple[Field, ...]:
+    """Return the fields of `cls` that refer to :class:`ComponentList`, or dict-like of
+    the same.
+
+    The result depends only on `cls`, so it is cached instead of inspecting
+    :func:`~dataclasses.fields` for every :meth:`.Structure.grouping` call.
+    """
+    try:
+        return _GROUPING_FIELDS[cls]
+    except KeyError:
+        pass
+
+    result: List[Field] = []
+    for f in fields(cls):
+        types = get_args(f.type) or (f.type,)
+        try:
+            if any(issubclass(t, ComponentList) for t in types):
+                result.append(f)
+        except TypeError:
+            pass
+    return _GROUPING_FIELDS.setdefault(cls, tuple(result))
+
+
 @dataclass(repr=False)
 class Structure(MaintainableArtefact):
     @property
     def grouping(self) -> Sequence[ComponentList]:
         """A collection of all the ComponentLists associated with a subclass."""
-        result: List[ComponentList] = []
-        for f in fields(self):
-            types = get_args(f.type) or (f.type,)
-            try:
-                if any(issubclass(t, ComponentList) for t in types):
-                    result.append(getattr(self, f.name))
-            except TypeError:
-                pass
-        return result
+        return [getattr(self, f.name) for f in _grouping_fields(type(self))]
 
     def replace_grouping(self, cl: ComponentList) -> None:
         """Replace existing component list with `cl`."""
         field = None
-        for f in fields(self):
+        for f in _grouping_fields(type(self)):
             is_dictlike = get_origin(f.type) is DictLikeDescriptor
             if f.type == type(cl) or (is_dictlike and get_args(f.type)[1] is type(cl)):
                 field = f
@@ -1322,9 +1341,16 @@ class BaseDataStructureDefinition(Structure, ConstrainableArtefact):
         # NB for performance, the implementation tries to use iterators and avoid
         #    constructing full-length tuples/lists at any point
 
-        _constraint = constraint or NullConstraint
         dims = dims or [dim.id for dim in self.dimensions.components]
 
+        # Utility to filter `iterable` through `constraint`, if any. With no
+        # constraint, return `iterable` itself, avoiding one call to
+        # NullConstraint.__contains__() for every KeyValue and Key
+        def _filter(iterable):
+            if constraint is None:
+                return iterable
+            return filter(constraint.__contains__, iterable)
+
         # Utility to return an immutable function that produces KeyValues. The
         # arguments are frozen so these can be set using loop variables and stored in a
         # map() object that isn't modified on future loops
@@ -1350,8 +1376,7 @@ class BaseDataStructureDefinition(Structure, ConstrainableArtefact):
                 # Create a KeyValue for each Item in the ItemScheme; filter through any
                 # constraint.
                 all_kvs.append(
-                    filter(
-                        _constraint.__contains__,
+                    _filter(
                         map(
                             make_factory(id=dim.id, value_for=dim),
                             dim.local_representation.enumerated,
@@ -1362,7 +1387,7 @@ class BaseDataStructureDefinition(Structure, ConstrainableArtefact):
         # Create Key objects from Cartesian product of KeyValues along each dimension
         # NB this does not work with DataKeySet
         # TODO improve to work with DataKeySet
-        yield from filter(_constraint.__contains__, map(Key, product(*all_kvs)))
+        yield from _filter(map(Key, product(*all_kvs)))
 
     def make_constraint(self, key):
         """Return a constraint for `key`.
@@ -1513,10 +1538,14 @@ class BaseDataStructureDefinition(Structure, ConstrainableArtefact):
 
         key = key_cls(**args)
 
+        # IDs of DataAttributes; membership in a frozenset avoids comparing `id` to
+        # every DataAttribute in turn using IdentifiableArtefact.__eq__()
+        attribute_ids = frozenset(da.id for da in self.attributes.components)
+
         # Convert keyword arguments to either KeyValue or AttributeValue
         keyvalues = []
         for order, (id, value) in enumerate(values.items()):
-            if id in self.attributes.components:
+            if id in attribute_ids:
                 # Reference a DataAttribute from the AttributeDescriptor
                 da = attr(id)
                 # Store the attribute value, referencing da
@@ -1738,14 +1767,19 @@ class Key:
     values: DictLikeDescriptor[str, KeyValue] = DictLikeDescriptor()
 
     def __init__(self, arg: Union[Mapping, Sequence[KeyValue], None] = None, **kwargs):
-        # Handle kwargs corresponding to attributes
-        self.attrib.update(kwargs.pop("attrib", {}))
+        # Handle kwargs corresponding to attributes. If there are none, the empty
+        # DictLike for `attrib` is only created when first accessed
+        attrib = kwargs.pop("attrib", None)
+        if attrib:
+            self.attrib.update(attrib)
 
         # DimensionDescriptor
         dd = kwargs.pop("described_by", None)
         self.described_by = dd
 
-        if arg and isinstance(arg, Mapping):
+        # NB isinstance() with the collections.abc classes is much faster than with the
+        #    equivalent aliases in typing
+        if arg and isinstance(arg, collections.abc.Mapping):
             if len(kwargs):
                 raise ValueError(
                     "Key() accepts either a single argument, or keyword arguments; not "
@@ -1755,7 +1789,7 @@ class Key:
 
         kvs: Iterable[Tuple] = []
 
-        if isinstance(arg, Sequence):
+        if isinstance(arg, collections.abc.Sequence):
             # Sequence of already-prepared KeyValues; assume already sorted
             kvs = map(lambda kv: (kv.id, kv), arg)
         else:
@@ -2626,6 +2660,7 @@ class ClassFinder:
 
         return cls
 
+    @lru_cache()
     def parent_class(self, cls):
         """Return the class that contains objects of type `cls`.
 
@@ -1,6 +1,7 @@
 """SDMX 2.1 Information Model."""
 
 import logging
+import sys
 
 # TODO for complete implementation of the IM, enforce TimeKeyValue (instead of KeyValue)
 #      for {Generic,StructureSpecific} TimeSeriesDataSet.
@@ -95,6 +96,12 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+#: Keyword arguments for :func:`.dataclass` to generate ``__slots__`` on Python ≥ 3.10.
+#: Only applied to classes without a base class that has a per-instance ``__dict__``,
+#: and that do not use :class:`.DictLikeDescriptor`, since otherwise slots give no
+#: benefit.
+_SLOTS = dict(slots=True) if sys.version_info >= (3, 10) else dict()
+
 
 # §10.3: Constraints
 
@@ -156,10 +163,11 @@ class Constraint(common.BaseConstraint):
     # metadata_content_keys: MetadataKeySet = None
 
     def __contains__(self, value):
-        if self.data_content_keys is None:
+        dck = self.data_content_keys
+        if dck is None:
             raise NotImplementedError("Constraint does not contain a DataKeySet")
 
-        return value in self.data_content_keys
+        return value in dck
 
 
 class MemberSelection(common.BaseMemberSelection):
@@ -176,18 +184,25 @@ class ContentConstraint(Constraint, common.BaseContentConstraint):
     metadata_content_region: Optional[common.MetadataTargetRegion] = None
 
     def __contains__(self, value):
-        if self.data_content_region:
-            return all(value in cr for cr in self.data_content_region)
-        else:
+        crs = self.data_content_region
+        if not crs:
             raise NotImplementedError("ContentConstraint does not contain a CubeRegion")
 
+        # NB this is called once per key or KeyValue by iter_keys(), so use a plain
+        #    loop that returns early rather than all() with a generator expression
+        for cr in crs:
+            if value not in cr:
+                return False
+        return True
+
     def to_query_string(self, structure):
-        cr_count = len(self.data_content_region)
+        crs = self.data_content_region
+        cr_count = len(crs)
         try:
             if cr_count > 1:
-                log.warning(f"to_query_string() using first of {cr_count} CubeRegions")
+                log.warning("to_query_string() using first of %d CubeRegions", cr_count)
 
-            return self.data_content_region[0].to_query_string(structure)
+            return crs[0].to_query_string(structure)
         except IndexError:
             raise RuntimeError("ContentConstraint does not contain a CubeRegion")
 
@@ -205,8 +220,10 @@ class ContentConstraint(Constraint, common.BaseContentConstraint):
         --------
         .DataStructureDefinition.iter_keys
         """
-        if obj not in self.content:
-            log.warning(f"{repr(obj)} is not in {repr(self)}.content")
+        # NB use lazy formatting; repr() of `obj` and `self` is only computed if the
+        #    message is emitted
+        if log.isEnabledFor(logging.WARNING) and obj not in self.content:
+            log.warning("%r is not in %r.content", obj, self)
 
         yield from obj.iter_keys(constraint=self, dims=dims)
 
@@ -261,9 +278,9 @@ class ReportingYearStartDay(DataAttribute):
 class DataStructureDefinition(common.BaseDataStructureDefinition):
     """SDMX 2.1 DataStructureDefinition (‘DSD’)."""
 
-    MemberValue = MemberValue
-    MemberSelection = MemberSelection
-    ConstraintType = ContentConstraint
+    MemberValue: ClassVar[Type[common.BaseMemberValue]] = MemberValue
+    MemberSelection: ClassVar[Type[common.BaseMemberSelection]] = MemberSelection
+    ConstraintType: ClassVar[Type[common.BaseConstraint]] = ContentConstraint
 
     #: A :class:`.MeasureDescriptor`.
     measures: MeasureDescriptor = field(default_factory=MeasureDescriptor)
@@ -389,21 +406,21 @@ class MetadataflowDefinition(common.BaseMetadataflow):
 # §7.4: Metadata Set
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TargetObjectValue:
     """SDMX 2.1 TargetObjectValue."""
 
     value_for: TargetObject
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TargetReportPeriod(TargetObjectValue):
     """SDMX 2.1 TargetReportPeriod."""
 
     report_period: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TargetIdentifiableObject(TargetObjectValue):
     """SDMX 2.1 TargetIdentifiableObject."""
 
@@ -417,7 +434,7 @@ class TargetObjectKey:
     key_values: DictLikeDescriptor[str, TargetObjectValue] = DictLikeDescriptor()
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ReportedAttribute:
     """SDMX 2.1 ReportedAttribute.
 
@@ -472,7 +489,7 @@ class XHTMLAttributeValue(NonEnumeratedAttributeValue, common.BaseXHTMLAttribute
     value: str
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MetadataReport:
     """SDMX 2.1 MetadataReport."""
 
@@ -521,8 +538,10 @@ class HierarchicalCodelist(common.MaintainableArtefact):
     hierarchy: List[Hierarchy] = field(default_factory=list)
 
     def __repr__(self) -> str:
-        tmp = super(NameableArtefact, self).__repr__()[:-1]
-        return f"{tmp}: {len(self.hierarchy)} hierarchies>"
+        # Same as IdentifiableArtefact.__repr__(), plus the number of hierarchies
+        return (
+            f"<{self.__class__.__name__} {self.id}: {len(self.hierarchy)} hierarchies>"
+        )
 
 
 # §9: Structure Set and Mappings
@@ -3,7 +3,7 @@
 from dataclasses import dataclass, field
 from datetime import date
 from enum import Enum
-from typing import Any, ClassVar, Dict, List, Optional, Set
+from typing import Any, ClassVar, Dict, List, Optional, Set, Type
 
 from . import common
 from .common import (
@@ -348,9 +348,9 @@ class ObservationRelationship(common.AttributeRelationship):
 class DataStructureDefinition(common.BaseDataStructureDefinition):
     """SDMX 3.0 DataStructureDefinition (‘DSD’)."""
 
-    MemberValue = MemberValue
-    MemberSelection = MemberSelection
-    ConstraintType = DataConstraint
+    MemberValue: ClassVar[Type[common.BaseMemberValue]] = MemberValue
+    MemberSelection: ClassVar[Type[common.BaseMemberSelection]] = MemberSelection
+    ConstraintType: ClassVar[Type[common.BaseConstraint]] = DataConstraint
 
     #: A :class:`.MeasureDescriptor`.
     measures: MeasureDescriptor = field(default_factory=MeasureDescriptor)
@@ -1,3 +1,5 @@
+import pickle
+import sys
 from operator import attrgetter
 from typing import List
 
@@ -485,6 +487,13 @@ class TestKey:
         # KeyValue is associated with Dimension
         assert k["FOO"].value_for is d
 
+        # No attributes
+        assert 0 == len(k.attrib)
+
+        # Construct with attributes
+        k = Key(FOO=1, attrib=dict(BAR=AttributeValue(value="baz")))
+        assert "baz" == k.attrib["BAR"]
+
     def test_eq(self, k1) -> None:
         # Invalid comparison
         with pytest.raises(ValueError):
@@ -584,6 +593,18 @@ class TestDataSet:
         assert ds0.action == ds1.action
 
 
+class TestReportedAttribute:
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="No dataclass(slots=...)")
+    def test_slots(self) -> None:
+        ra = model.ReportedAttribute(value_for=model.MetadataAttribute(id="FOO"))
+
+        # No per-instance __dict__
+        assert not hasattr(ra, "__dict__")
+
+        # Instances can still be pickled
+        assert ra == pickle.loads(pickle.dumps(ra))
+
+
 class TestMetadataSet:
     @pytest.fixture(scope="class")
     def msg(self, specimen) -> sdmx.message.MetadataMessage:
@@ -649,3 +670,10 @@ class TestHierarchicalCodelist:
 
     def test_repr(self, obj: model.HierarchicalCodelist):
         assert "<HierarchicalCodelist HCL_COUNTRY: 1 hierarchies>" == repr(obj)
+
+    def test_repr_constructed(self) -> None:
+        # Maintainer, version, and name are not included
+        hcl = model.HierarchicalCodelist(
+            id="HCL_FOO", name="Foo", version="1.0", hierarchy=[model.Hierarchy()]
+        )
+        assert "<HierarchicalCodelist HCL_FOO: 1 hierarchies>" == repr(hcl)
@@ -85,6 +85,12 @@ class TestDictLike:
         with pytest.raises(TypeError):
             f.items[123] = 456
 
+        # Setting an empty value replaces existing contents with an empty, typed
+        # DictLike on next access
+        f = Foo(items={"a": 1})
+        f.items = None
+        assert 0 == len(f.items) and (str, int) == f.items._types
+
     def test_compare(self, caplog):
         dl1 = DictLike(a="foo", b="bar")
         dl2 = DictLike(c="baz", a="foo")